@@ -1,9 +1,84 @@
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import ciso8601
+import numpy as np
+import orjson
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
 import plotly.express as px
 import plotly.graph_objects as go
 
+from data_utils import fast_concat
+
+SUPABASE_URL = "https://xbzzjcurduwqxhpyspom.supabase.co/rest/v1"
+
+# Durable on-disk cache so a server restart doesn't re-pull every table.
+# TTL per table: the live tables refresh every 30 min, the historical
+# matched_betting_bets table only every 6 hours.
+CACHE_DIR = ".cache"
+CACHE_TTLS = {
+    "betting_analytics": 30 * 60,
+    "ev_daily_bets": 30 * 60,
+    "matched_betting_bets": 6 * 60 * 60,
+}
+
+
+def cache_path(table_name):
+    return os.path.join(CACHE_DIR, f"{table_name}.parquet")
+
+
+def restore_arrow_dtypes(df):
+    """Give a Parquet round-trip the same dtypes a fresh fetch produces.
+
+    to_pandas() hands back object strings and object-backed categories, so
+    without this the loader's output dtype depends on which cache layer
+    answered - forfeiting the Arrow hash kernels on warm restarts and mixing
+    category backings in fast_concat. odds_bin is left alone: its labels are
+    plain strings on both paths.
+    """
+    arrow_string = pd.ArrowDtype(pa.string())
+    for col in df.columns:
+        if df[col].dtype == object:
+            df[col] = df[col].astype(arrow_string)
+        elif isinstance(df[col].dtype, pd.CategoricalDtype) and col != 'odds_bin':
+            df[col] = df[col].cat.rename_categories(
+                df[col].cat.categories.astype(arrow_string)
+            )
+    return df
+
+
+def read_cached_table(table_name):
+    """Return the cached frame for a table if it exists and is fresh, else None."""
+    path = cache_path(table_name)
+    ttl = CACHE_TTLS.get(table_name, 30 * 60)
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            return restore_arrow_dtypes(pq.read_table(path).to_pandas())
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def write_cached_table(table_name, df):
+    path = cache_path(table_name)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        df.to_parquet(path, compression='zstd')
+    except OSError:
+        pass  # cache is best-effort; serve the freshly fetched frame regardless
+
+# Shared session so all page requests reuse pooled keep-alive connections
+# (avoids a TLS handshake per page)
+session = requests.Session()
+
 # Set page configuration for wider layout
 st.set_page_config(
     page_title="Betting Analytics Dashboard",
@@ -13,84 +88,218 @@ st.set_page_config(
 )
 
 # Download data from Supabase with pagination and duplicate handling
-@st.cache_data
+@st.cache_data(ttl=300)
 def load_data(table_name):
+    # Serve from the on-disk Parquet cache when it is still within TTL;
+    # pyarrow round-trips datetime64[ns, UTC] so downstream .dt logic is unchanged
+    cached = read_cached_table(table_name)
+    if cached is not None:
+        st.sidebar.success(f"✅ Cleaned data: {len(cached)} records from {table_name} (disk cache)")
+        return cached
+
     # Use Streamlit secrets for API keys
     headers = {
         "apikey": st.secrets["SUPABASE_KEY"],
         "Authorization": f"Bearer {st.secrets['SUPABASE_KEY']}"
     }
     
-    all_data = []
-    page = 0
+    url = f"{SUPABASE_URL}/{table_name}?select=*"
     limit = 1000
-    
-    while True:
-        start = page * limit
-        
-        response = requests.get(
-            f"https://xbzzjcurduwqxhpyspom.supabase.co/rest/v1/{table_name}?select=*",
-            headers=headers,
-            params={
-                "limit": limit,
-                "offset": start
-            }
+
+    # Ask for the total row count up front so all pages can be fetched in parallel
+    count_response = session.head(
+        url,
+        headers={**headers, "Prefer": "count=exact", "Range-Unit": "items", "Range": "0-0"}
+    )
+
+    if count_response.status_code not in (200, 206):
+        st.error(f"Error loading data from {table_name}: {count_response.status_code}")
+        return None
+
+    try:
+        total = int(count_response.headers.get("Content-Range", "").split("/")[-1])
+    except ValueError:
+        st.error(f"Could not read row count for {table_name}")
+        return None
+
+    # Workers only record failures; they're reported below from the caller's
+    # thread, since st.error from an executor thread would be dropped
+    failed_pages = []
+
+    def fetch_range(bounds):
+        start, end = bounds
+        response = session.get(
+            url,
+            headers={**headers, "Range-Unit": "items", "Range": f"{start}-{end}"}
         )
-        
-        if response.status_code == 200:
-            data = response.json()
-            if not data:
-                break
-            all_data.extend(data)
-            page += 1
-            
-            if len(data) < limit:
-                break
-        else:
-            st.error(f"Error loading data from {table_name}: {response.status_code}")
-            break
-    
+        if response.status_code in (200, 206):
+            # orjson decodes Supabase's wide payloads a few times faster
+            # than the stdlib json used by response.json()
+            return orjson.loads(response.content)
+        failed_pages.append((start, response.status_code))
+        return []
+
+    # Fan out one GET per 1000-row page instead of paging serially
+    ranges = [(start, start + limit - 1) for start in range(0, total, limit)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        pages = list(executor.map(fetch_range, ranges))
+
+    if failed_pages:
+        # Don't present a truncated dataset as a successful load
+        statuses = sorted({status for _, status in failed_pages})
+        st.error(
+            f"Error loading data from {table_name}: "
+            f"{len(failed_pages)} of {len(ranges)} pages failed (HTTP {statuses})"
+        )
+        return None
+
+    all_data = list(itertools.chain.from_iterable(pages))
+
     if all_data:
-        df = pd.DataFrame(all_data)
-        
-        # FIXED: Better date conversion with error handling
+        # Build through Arrow rather than pd.DataFrame(list_of_dicts): string
+        # columns come back Arrow-backed instead of boxed Python objects, so
+        # groupby/unique/duplicated run in Arrow's C++ hash kernels
+        df = pa.Table.from_pylist(all_data).to_pandas(types_mapper=pd.ArrowDtype)
+
+        # Supabase returns ISO-8601 timestamptz; ciso8601 parses that faster than
+        # pandas' own ISO path, so use it directly and only fall back to
+        # pd.to_datetime if a malformed value slips through
         date_cols = ['start_time', 'bet_logged', 'created_at']
         for col in date_cols:
             if col in df.columns:
                 try:
-                    # Convert to datetime, coerce errors to NaT
+                    raw = df[col].to_numpy()
+                    mask = pd.notna(raw)
+                    out = np.empty(len(raw), dtype='datetime64[ns]')
+                    out[~mask] = np.datetime64('NaT')
+                    out[mask] = np.array(
+                        [ciso8601.parse_datetime(s) for s in raw[mask]],
+                        dtype='datetime64[ns]'
+                    )
+                    df[col] = pd.DatetimeIndex(out, tz='UTC')
+                except ValueError:
                     df[col] = pd.to_datetime(df[col], errors='coerce', utc=True)
-                    
-                    # Log conversion results
-                    null_count = df[col].isnull().sum()
-                    if null_count > 0:
-                        st.sidebar.warning(f"⚠️ {null_count} {col} values could not be converted to datetime in {table_name}")
-                    
-                except Exception as e:
-                    st.sidebar.error(f"❌ Error converting {col} in {table_name}: {e}")
-                    # Keep original column if conversion fails
+
+                # Log conversion results
+                null_count = df[col].isnull().sum()
+                if null_count > 0:
+                    st.sidebar.warning(f"⚠️ {null_count} {col} values could not be converted to datetime in {table_name}")
         
-        # Remove duplicate bets across bookmakers
+        # Remove duplicate IDs if they exist. Cross-bookmaker dedup is opt-in
+        # via the sidebar radio and lives solely in remove_duplicate_bets now,
+        # so it isn't repeated here on every load
         original_count = len(df)
-        
-        if table_name == "ev_daily_bets":
-            # For ev_daily_bets, keep only one record per unique bet combination
-            unique_cols = ['event', 'start_time', 'outcome', 'stake', 'odds']
-            if all(col in df.columns for col in unique_cols):
-                df = df.drop_duplicates(subset=unique_cols, keep='first')
-        
-        # Remove duplicate IDs if they exist
+
         if 'id' in df.columns:
-            df = df.drop_duplicates(subset=['id'], keep='first')
-        
+            dup_mask = df.duplicated(subset=['id'], keep='first').to_numpy()
+            if dup_mask.any():
+                df = df.loc[~dup_mask]
+
+        # Category dtype lets groupby/duplicated work on integer codes instead
+        # of hashing Python strings, and roughly halves the column's memory
+        for col in ('bookmaker', 'sport', 'outcome', 'event', 'data_source'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+
+        # float32 is plenty for money amounts and odds, and halves the memory
+        # bandwidth of every sum/mean/groupby over these columns. Materialize
+        # as numpy float32 (not float[pyarrow], which to_numeric returns for
+        # Arrow input) so nulls are plain NaN and .to_numpy() never produces
+        # an object array of pd.NA downstream
+        for col in ('profit', 'stake', 'odds', 'ev', 'logged_ev'):
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors='coerce', downcast='float').astype('float32')
+
+        # Bin odds once per data refresh with a single searchsorted pass;
+        # pd.cut would rebuild an IntervalIndex on every rerun
+        if 'odds' in df.columns:
+            bins = np.array([1.5, 2, 3, 5, 10])
+            labels = ['1-1.5', '1.5-2', '2-3', '3-5', '5-10', '10+']
+            odds = df['odds'].to_numpy(dtype='float64')
+            codes = np.searchsorted(bins, odds)
+            # Match the baseline pd.cut(bins=[0, ..., 100]) edges: NaN and
+            # anything outside (0, 100] gets no bin
+            codes[~((odds > 0) & (odds <= 100))] = -1
+            df['odds_bin'] = pd.Categorical.from_codes(codes, labels)
+
+        df = precompute_cumulative_profit(df, canonical_date_col(df, table_name))
+
         removed_count = original_count - len(df)
         if removed_count > 0:
             st.sidebar.warning(f"⚠️ Removed {removed_count} duplicate bets from {table_name}")
         
+        write_cached_table(table_name, df)
+
         st.sidebar.success(f"✅ Cleaned data: {len(df)} records from {table_name}")
         return df
     return None
 
+@st.cache_data(ttl=30)
+def row_count(table_name):
+    """Current server-side row count via a HEAD request (one RTT, no body)."""
+    headers = {
+        "apikey": st.secrets["SUPABASE_KEY"],
+        "Authorization": f"Bearer {st.secrets['SUPABASE_KEY']}",
+        "Prefer": "count=exact",
+        "Range-Unit": "items",
+        "Range": "0-0",
+    }
+    response = session.head(f"{SUPABASE_URL}/{table_name}?select=*", headers=headers)
+    if response.status_code not in (200, 206):
+        return None
+    try:
+        return int(response.headers.get("Content-Range", "").split("/")[-1])
+    except ValueError:
+        return None
+
+
+def load_table(table_name):
+    """load_data plus a cheap staleness check.
+
+    On a cache hit, compare the cached frame against the server's row count;
+    if they diverge, drop both cache layers for this table and refetch instead
+    of serving stale data until the TTL runs out.
+    """
+    df = load_data(table_name)
+    if df is None:
+        return None
+    count = row_count(table_name)
+    if count is not None and count != len(df):
+        # Streamlit 1.28's CachedFunc.clear() takes no arguments (per-entry
+        # clear only arrived in 1.31), so drop every table's entry; the other
+        # tables just repopulate from their still-fresh Parquet files
+        load_data.clear()
+        try:
+            os.remove(cache_path(table_name))
+        except OSError:
+            pass
+        df = load_data(table_name)
+    return df
+
+
+def canonical_date_col(df, table_name):
+    """Pick the date column the Time Series tab will plot for this table."""
+    if table_name in ("matched_betting_bets", "All Tables") and 'start_time' in df.columns:
+        return 'start_time'
+    for col in ('bet_logged', 'created_at', 'start_time'):
+        if col in df.columns:
+            return col
+    return None
+
+
+def precompute_cumulative_profit(df, date_col):
+    """Sort by the event date and attach the running profit.
+
+    Done once per data refresh so the Time Series tab only has to apply a
+    boolean date mask per rerun instead of re-sorting and re-cumsumming.
+    """
+    if (date_col is not None and 'profit' in df.columns
+            and pd.api.types.is_datetime64_any_dtype(df[date_col])):
+        df.sort_values(date_col, inplace=True, ignore_index=True)
+        df['cumulative_profit'] = df['profit'].cumsum()
+    return df
+
+
 def remove_duplicate_bets(df, table_name):
     """Remove duplicate bets that are the same across multiple bookmakers"""
     original_count = len(df)
@@ -103,6 +312,44 @@ def remove_duplicate_bets(df, table_name):
     st.sidebar.info(f"Filtered to {len(df)} unique bets (removed {original_count - len(df)} duplicates)")
     return df
 
+# KPIs and groupby aggregates are pure functions of the frame, so cache them
+# instead of rescanning the full frame on every widget interaction
+@st.cache_data(ttl=600)
+def compute_kpis(df):
+    # One pass over the raw numpy array; (df['profit'] > 0).mean() would
+    # allocate a full bool Series just to average it. na_value keeps nulls as
+    # NaN even if the column arrives Arrow-backed, and nansum skips them the
+    # way Series.sum() always did (NaN > 0 is already False for the win rate)
+    profit = df['profit'].to_numpy(dtype='float64', na_value=np.nan)
+    total_profit = float(np.nansum(profit))
+    win_rate = float(np.count_nonzero(profit > 0)) / profit.size if profit.size else 0.0
+
+    if 'ev' in df.columns:
+        avg_ev = df['ev'].mean()
+    elif 'logged_ev' in df.columns:
+        avg_ev = df['logged_ev'].mean()
+    else:
+        avg_ev = 0
+
+    total_stake = df['stake'].sum() if 'stake' in df.columns else 0
+
+    return dict(
+        total_profit=total_profit,
+        win_rate=win_rate,
+        avg_ev=avg_ev,
+        total_stake=total_stake,
+        combined_yield=(total_profit / total_stake) * 100 if total_stake > 0 else None,
+    )
+
+@st.cache_data(ttl=600)
+def yield_by(df, col):
+    out = df.groupby(col, observed=True).agg({
+        'profit': 'sum',
+        'stake': 'sum'
+    }).reset_index()
+    out['yield'] = (out['profit'] / out['stake']) * 100
+    return out
+
 # Dashboard title
 st.title("📊 DCP Betting Analytics Dashboard")
 
@@ -125,28 +372,43 @@ duplicate_handling = st.sidebar.radio(
 
 # Load selected data
 if table_option == "All Tables":
-    df1 = load_data("betting_analytics")
-    df2 = load_data("ev_daily_bets")
-    df3 = load_data("matched_betting_bets")
-    
+    # Load the three tables concurrently so cold start pays the slowest
+    # table's latency rather than the sum of all three. The worker threads
+    # need the ScriptRunContext attached, otherwise every st.sidebar/st.error
+    # call inside load_data is silently dropped
+    script_ctx = get_script_run_ctx()
+
+    def load_table_with_ctx(table_name):
+        add_script_run_ctx(threading.current_thread(), script_ctx)
+        return load_table(table_name)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        df1, df2, df3 = executor.map(
+            load_table_with_ctx, ["betting_analytics", "ev_daily_bets", "matched_betting_bets"]
+        )
+
     if df1 is not None and df2 is not None and df3 is not None:
         # Add source identifier
-        df1['data_source'] = 'betting_analytics'
-        df2['data_source'] = 'ev_daily_bets'
-        df3['data_source'] = 'matched_betting_bets'
-        
+        df1['data_source'] = pd.Categorical(['betting_analytics'] * len(df1))
+        df2['data_source'] = pd.Categorical(['ev_daily_bets'] * len(df2))
+        df3['data_source'] = pd.Categorical(['matched_betting_bets'] * len(df3))
+
         # Apply duplicate handling if selected
         if duplicate_handling == "Keep first occurrence only":
             df2 = remove_duplicate_bets(df2, 'ev_daily_bets')
-        
-        # Combine data
-        df_combined = pd.concat([df1, df2, df3], ignore_index=True)
+
+        # Combine data; the per-table sort/cumsum doesn't survive the union,
+        # so redo it on the combined frame
+        df_combined = fast_concat([df1, df2, df3])
+        df_combined = precompute_cumulative_profit(
+            df_combined, canonical_date_col(df_combined, "All Tables")
+        )
         df = df_combined
     else:
         st.error("Failed to load one or more tables from Supabase")
         st.stop()
 else:
-    df = load_data(table_option)
+    df = load_table(table_option)
     if df is None:
         st.error(f"Failed to load data from {table_option} table")
         st.stop()
@@ -154,6 +416,10 @@ else:
     # Apply duplicate handling if selected
     if duplicate_handling == "Keep first occurrence only" and table_option == "ev_daily_bets":
         df = remove_duplicate_bets(df, 'ev_daily_bets')
+        # Dedup dropped rows, so the running total precomputed in load_data
+        # still includes the removed duplicates' profit; rebuild it (the
+        # All Tables branch already does this on the combined frame)
+        df = precompute_cumulative_profit(df, canonical_date_col(df, table_option))
 
 # Display data source info
 if table_option == "All Tables":
@@ -193,28 +459,23 @@ if date_col_to_check in df.columns:
 st.header("📈 Key Performance Indicators")
 
 # First row of metrics
+kpis = compute_kpis(df)
+total_profit = kpis['total_profit']
+win_rate = kpis['win_rate']
+
 col1, col2, col3, col4, col5 = st.columns(5)
 
 with col1:
     st.metric("Total Bets", f"{len(df):,}")
 with col2:
-    total_profit = df['profit'].sum()
     st.metric("Total Profit", f"R{total_profit:,.2f}")
 with col3:
-    if 'ev' in df.columns:
-        avg_ev = df['ev'].mean()
-    elif 'logged_ev' in df.columns:
-        avg_ev = df['logged_ev'].mean()
-    else:
-        avg_ev = 0
-    st.metric("Avg EV", f"{avg_ev:.1f}%")
+    st.metric("Avg EV", f"{kpis['avg_ev']:.1f}%")
 with col4:
-    win_rate = (df['profit'] > 0).mean()
     st.metric("Win Rate", f"{win_rate:.1%}")
 with col5:
-    if 'stake' in df.columns and df['stake'].sum() > 0:
-        combined_yield = (total_profit / df['stake'].sum()) * 100
-        st.metric("Combined Yield", f"{combined_yield:.1f}%")
+    if kpis['combined_yield'] is not None:
+        st.metric("Combined Yield", f"{kpis['combined_yield']:.1f}%")
     else:
         st.metric("Combined Yield", "N/A")
 
@@ -247,11 +508,7 @@ with tab1:
         # 1. Yield by Bookmaker
         if 'bookmaker' in df.columns and 'stake' in df.columns:
             st.subheader("📈 Yield by Bookmaker")
-            bookmaker_yield = df.groupby('bookmaker').agg({
-                'profit': 'sum',
-                'stake': 'sum'
-            }).reset_index()
-            bookmaker_yield['yield'] = (bookmaker_yield['profit'] / bookmaker_yield['stake']) * 100
+            bookmaker_yield = yield_by(df, 'bookmaker')
 
             fig1 = px.bar(bookmaker_yield, x='bookmaker', y='yield', 
                           title=f"Yield % by Bookmaker",
@@ -260,11 +517,9 @@ with tab1:
             st.plotly_chart(fig1, use_container_width=True)
     
     with col_chart2:
-        # 2. Profit by Odds Range
-        if 'odds' in df.columns:
+        # 2. Profit by Odds Range (odds_bin is precomputed in load_data)
+        if 'odds_bin' in df.columns:
             st.subheader("🎯 Profit by Odds Range")
-            df['odds_bin'] = pd.cut(df['odds'], bins=[0, 1.5, 2, 3, 5, 10, 100], 
-                                    labels=['1-1.5', '1.5-2', '2-3', '3-5', '5-10', '10+'])
             odds_profit = df.groupby('odds_bin')['profit'].sum().reset_index()
 
             fig2 = px.bar(odds_profit, x='odds_bin', y='profit', 
@@ -282,12 +537,8 @@ with tab1:
         
         with col_comp1:
             # Yield by data source
-            source_yield = df.groupby('data_source').agg({
-                'profit': 'sum',
-                'stake': 'sum'
-            }).reset_index()
-            source_yield['yield'] = (source_yield['profit'] / source_yield['stake']) * 100
-            
+            source_yield = yield_by(df, 'data_source')
+
             fig_comparison = px.bar(source_yield, x='data_source', y='yield',
                                    title="Yield Comparison Between Tables",
                                    color='data_source')
@@ -309,12 +560,7 @@ with tab2:
     with col_analysis1:
         # Sport analysis
         if 'sport' in df.columns:
-            sport_profit = df.groupby('sport').agg({
-                'profit': 'sum',
-                'stake': 'sum'
-            }).reset_index()
-            sport_profit['yield'] = (sport_profit['profit'] / sport_profit['stake']) * 100
-            sport_profit = sport_profit.sort_values('profit', ascending=False)
+            sport_profit = yield_by(df, 'sport').sort_values('profit', ascending=False)
             
             fig_sport = px.bar(sport_profit.head(10), x='sport', y='profit',
                               title="Top 10 Sports by Profit")
@@ -368,35 +614,46 @@ with tab3:
                     # Timezone-aware - keep as UTC
                     comparison_time = current_time
                 
-                # Filter out future dates
-                df_filtered = df[df[date_col] <= comparison_time].copy()
+                # Filter out future dates. Compare raw datetime64 arrays (both
+                # sides normalized to naive UTC) and skip the defensive copy -
+                # downstream only reads the filtered frame
+                cutoff = np.datetime64(
+                    comparison_time.tz_convert(None) if comparison_time.tz is not None
+                    else comparison_time
+                )
+                df_filtered = df.loc[df[date_col].to_numpy(dtype='datetime64[ns]') <= cutoff]
                 
                 if len(df_filtered) < len(df):
                     future_count = len(df) - len(df_filtered)
                     st.info(f"Filtered out {future_count} future records to fix timeline")
                 
                 if len(df_filtered) > 0:
-                    # Sort by the chosen date column
-                    df_sorted = df_filtered.sort_values(date_col)
-                    
-                    # Calculate cumulative profit
-                    df_sorted['cumulative_profit'] = df_sorted['profit'].cumsum()
-                    
-                    # Add data source to hover info if we have multiple tables
+                    # The frame comes presorted from load_data with
+                    # cumulative_profit attached, so no per-rerun sort/cumsum
+                    df_sorted = df_filtered
+                    if 'cumulative_profit' not in df_sorted.columns:
+                        df_sorted = df_sorted.sort_values(date_col)
+                        df_sorted = df_sorted.assign(cumulative_profit=df_sorted['profit'].cumsum())
+
+                    # Render with WebGL (Scattergl) - Plotly's SVG line chokes
+                    # visibly above ~10k points
+                    fig_cumulative = go.Figure()
                     if table_option == "All Tables" and 'data_source' in df_sorted.columns:
-                        hover_data = ['data_source']
                         # Show breakdown by source in legend
-                        fig_cumulative = px.line(df_sorted, x=date_col, y='cumulative_profit', 
-                                               title=f"Cumulative Profit Over Time - {table_option}",
-                                               labels={'cumulative_profit': 'Cumulative Profit ($)', date_col: date_label},
-                                               color='data_source',
-                                               hover_data=hover_data)
+                        for source, group in df_sorted.groupby('data_source', observed=True):
+                            fig_cumulative.add_trace(go.Scattergl(
+                                x=group[date_col], y=group['cumulative_profit'],
+                                mode='lines', name=str(source)))
                     else:
                         # Single table - just one line
-                        fig_cumulative = px.line(df_sorted, x=date_col, y='cumulative_profit', 
-                                               title=f"Cumulative Profit Over Time - {table_option}",
-                                               labels={'cumulative_profit': 'Cumulative Profit ($)', date_col: date_label})
-                    
+                        fig_cumulative.add_trace(go.Scattergl(
+                            x=df_sorted[date_col], y=df_sorted['cumulative_profit'],
+                            mode='lines', showlegend=False))
+                    fig_cumulative.update_layout(
+                        title=f"Cumulative Profit Over Time - {table_option}",
+                        xaxis_title=date_label,
+                        yaxis_title='Cumulative Profit ($)')
+
                     fig_cumulative.add_hline(y=0, line_dash="dash", line_color="red", 
                                            annotation_text="Break-even")
                     
@@ -436,15 +693,23 @@ with tab3:
             
             for source, source_df in [('betting_analytics', df1), ('ev_daily_bets', df2), ('matched_betting_bets', df3)]:
                 if 'start_time' in source_df.columns and pd.api.types.is_datetime64_any_dtype(source_df['start_time']) and 'profit' in source_df.columns:
-                    source_df['month'] = source_df['start_time'].dt.to_period('M')
-                    monthly_profit = source_df.groupby('month')['profit'].sum().reset_index()
+                    # Group on an int yyyymm key instead of to_period('M'),
+                    # which allocates a Period object per row; NaT rows are
+                    # masked out up front (to_period dropped them too)
+                    valid = source_df['start_time'].notna()
+                    dt = source_df.loc[valid, 'start_time'].dt
+                    key = (dt.year.astype('int32') * 100 + dt.month.astype('int8')).rename('month')
+                    monthly_profit = (source_df.loc[valid]
+                                      .groupby(key, observed=True)['profit']
+                                      .sum().reset_index())
                     monthly_profit['data_source'] = source
                     monthly_data.append(monthly_profit)
-            
+
             if monthly_data:
                 monthly_df = pd.concat(monthly_data, ignore_index=True)
-                monthly_df['month'] = monthly_df['month'].astype(str)
-                
+                monthly_df['month'] = ((monthly_df['month'] // 100).astype(str) + '-' +
+                                       (monthly_df['month'] % 100).astype(str).str.zfill(2))
+
                 # Create stacked bar chart
                 fig_monthly = px.bar(monthly_df, x='month', y='profit', color='data_source',
                                     title="Monthly Profit by Data Source",
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+
+def _missing_column(template, length):
+    """All-null filler matching the dtype of the peer frames' column.
+
+    Filling with the peer dtype keeps union_categoricals and the datetime
+    handling in fast_concat on one dtype per column; if the dtype can't
+    represent null we fall back to a plain object column.
+    """
+    filler = pd.Series([None] * length, dtype=object)
+    try:
+        return filler.astype(template.dtype)
+    except (TypeError, ValueError):
+        return filler
+
+
+def _align_category_backings(cats):
+    """Give every Categorical the same categories dtype before unioning.
+
+    A fresh Arrow-backed fetch carries string[pyarrow] categories while a
+    frame read back from the Parquet cache carries object categories;
+    union_categoricals refuses to mix the two, so cast divergent backings
+    down to object.
+    """
+    if len({cat.categories.dtype for cat in cats}) > 1:
+        cats = [cat.rename_categories(cat.categories.astype(object)) for cat in cats]
+    return cats
+
+
+def fast_concat(frames):
+    """Combine same-schema frames column-wise, avoiding pd.concat's full copy.
+
+    Categorical columns are merged via union_categoricals (pd.concat would
+    silently fall back to object dtype), datetime columns keep their timezone,
+    and everything else is a single np.concatenate per column. Columns missing
+    from a frame are filled with nulls in the peer frames' dtype.
+    """
+    columns = list(dict.fromkeys(col for frame in frames for col in frame.columns))
+    data = {}
+    for col in columns:
+        template = next(frame[col] for frame in frames if col in frame.columns)
+        parts = [frame[col] if col in frame.columns else _missing_column(template, len(frame))
+                 for frame in frames]
+        if any(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            cats = _align_category_backings([pd.Categorical(part) for part in parts])
+            data[col] = union_categoricals(cats)
+        elif any(pd.api.types.is_datetime64_any_dtype(part) for part in parts):
+            tz = next((part.dt.tz for part in parts
+                       if pd.api.types.is_datetime64_any_dtype(part) and part.dt.tz is not None),
+                      None)
+            values = np.concatenate([part.to_numpy(dtype='datetime64[ns]') for part in parts])
+            data[col] = pd.DatetimeIndex(values, tz=tz) if tz is not None else values
+        else:
+            data[col] = np.concatenate([part.to_numpy() for part in parts])
+    return pd.DataFrame(data, copy=False)
@@ -0,0 +1,84 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pa = pytest.importorskip("pyarrow")
+
+from data_utils import fast_concat
+
+
+def arrow_category(values):
+    """Category column as a fresh Arrow-backed fetch produces it."""
+    return pd.Series(values, dtype=pd.ArrowDtype(pa.string())).astype('category')
+
+
+def object_category(values):
+    """Category column as a Parquet cache round-trip produces it."""
+    return pd.Series(values, dtype='category')
+
+
+def test_combines_cache_hit_and_fresh_fetch_categories():
+    # One table fresh from Supabase (string[pyarrow] categories), one served
+    # from the disk cache (object categories) - the All Tables default after
+    # ~30 min of uptime; union_categoricals alone refuses this mix
+    fresh = pd.DataFrame({
+        'bookmaker': arrow_category(['bet365', 'hollywood']),
+        'profit': np.array([1.5, -2.0], dtype='float32'),
+    })
+    cached = pd.DataFrame({
+        'bookmaker': object_category(['hollywood', 'betway']),
+        'profit': np.array([3.0, 0.5], dtype='float32'),
+    })
+
+    out = fast_concat([fresh, cached])
+
+    assert len(out) == 4
+    assert isinstance(out['bookmaker'].dtype, pd.CategoricalDtype)
+    assert list(out['bookmaker']) == ['bet365', 'hollywood', 'hollywood', 'betway']
+    assert out['profit'].tolist() == [1.5, -2.0, 3.0, 0.5]
+
+
+def test_fills_missing_columns_with_peer_dtype():
+    # The three tables have divergent schemas (ev vs logged_ev etc.); a frame
+    # without the column gets nulls in the peers' dtype, not object
+    with_ev = pd.DataFrame({
+        'bookmaker': arrow_category(['bet365']),
+        'ev': np.array([4.2], dtype='float32'),
+    })
+    without_ev = pd.DataFrame({
+        'bookmaker': arrow_category(['betway']),
+    })
+
+    out = fast_concat([with_ev, without_ev])
+
+    assert len(out) == 2
+    assert np.isnan(out['ev'].iloc[1])
+    assert isinstance(out['bookmaker'].dtype, pd.CategoricalDtype)
+    assert out['bookmaker'].isna().sum() == 0
+
+
+def test_missing_categorical_column_still_unions():
+    has_sport = pd.DataFrame({
+        'sport': object_category(['soccer', 'tennis']),
+        'profit': np.array([1.0, 2.0], dtype='float32'),
+    })
+    no_sport = pd.DataFrame({
+        'profit': np.array([3.0], dtype='float32'),
+    })
+
+    out = fast_concat([has_sport, no_sport])
+
+    assert isinstance(out['sport'].dtype, pd.CategoricalDtype)
+    assert out['sport'].isna().tolist() == [False, False, True]
+
+
+def test_keeps_datetime_timezone():
+    times = pd.to_datetime(['2024-01-01T10:00:00Z', '2024-01-02T10:00:00Z'], utc=True)
+    first = pd.DataFrame({'start_time': times, 'profit': np.array([1.0, 2.0], dtype='float32')})
+    second = pd.DataFrame({'start_time': times, 'profit': np.array([3.0, 4.0], dtype='float32')})
+
+    out = fast_concat([first, second])
+
+    assert pd.api.types.is_datetime64_any_dtype(out['start_time'])
+    assert str(out['start_time'].dt.tz) == 'UTC'
+    assert len(out) == 4